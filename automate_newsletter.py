@@ -13,6 +13,7 @@ SETUP INSTRUCTIONS:
 ==================
 1. Install requirements:
    pip install requests python-dateutil pytz schedule
+   pip install orjson   # optional, faster JSON parsing/serialization
 
 2. Setup GitHub repository:
    - Create repo: crypto-intel-weekly
@@ -27,23 +28,84 @@ SETUP INSTRUCTIONS:
 
 4. Run once manually: python automate_newsletter.py
 5. For weekly automation: Set up cron job or GitHub Actions
+6. Optional, when batch-generating many weeks (e.g. back-testing):
+   pip install mypy && mypyc automate_newsletter.py
+   then run through the import system so the compiled extension is used:
+   python -c "import automate_newsletter as m; m.main()"
+   (`python automate_newsletter.py` always runs the .py source.) This
+   speeds up the pure-Python formatting; it is not worth it for one run.
 
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import base64
+import hashlib
 import json
-from datetime import datetime, timedelta
+import time
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 import os
-from typing import Dict, List
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 load_dotenv()
 
+json_loads: Callable[[Union[str, bytes]], Any]
+json_dumps: Callable[[Any], str]
+try:
+    import orjson
+
+    def _orjson_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+    json_dumps = _orjson_dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 
 # ================== CONFIGURATION ==================
+
+# Type aliases (precise types let mypyc compile the formatting code)
+Prices = Dict[str, Dict[str, float]]
+WeekRange = Tuple[str, str]
 COINGECKO_API = "https://api.coingecko.com/api/v3"
 GITHUB_API = "https://api.github.com"
 
+# Shared HTTP session: keep-alive connections plus backoff on throttling/5xx
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "PUT"]
+    )
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# (connect, read) timeout in seconds, so a stalled socket can't hang the cron
+TIMEOUT = (3.05, 10)
+
+# On-disk cache for API responses (CoinGecko's free tier throttles repeat calls)
+CACHE_DIR = os.path.expanduser("~/.cache/crypto_newsletter")
+CACHE_TTL = int(os.getenv('CACHE_TTL', 1800))  # seconds
+
+# Parsed newsletter templates keyed by path -> (mtime, Template)
+_TEMPLATE_CACHE: Dict[str, Tuple[float, Template]] = {}
+
+# SHA of the last index.html we deployed, saves a GET on the next deploy
+DEPLOY_STATE_FILE = '.deploy_state.json'
+
 # Token mapping for CoinGecko API
 TOKEN_MAP = {
     'btc': 'bitcoin',
@@ -54,76 +116,103 @@ TOKEN_MAP = {
     'pls': None,
     'hex': None
 }
+_TOKEN_IDS = ','.join(v for v in TOKEN_MAP.values() if v)
+
+# Placeholder prices for PLS and HEX (not on CoinGecko)
+PLACEHOLDER_PRICES = {
+    'pls': {
+        'price': 0.000089,
+        'change_24h': 12.4,
+        'ath': 0.000456,
+        'atl': 0.000021
+    },
+    'hex': {
+        'price': 0.0041,
+        'change_24h': 8.7,
+        'ath': 0.5701,
+        'atl': 0.00019
+    }
+}
+
+# ================== FILE OUTPUT ==================
+
+def atomic_write(path: str, text: str):
+    """Write text in one call to a temp file, then swap it into place"""
+    # A unique temp file per call, so concurrent writers never share one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; outputs are meant to be shared
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 # ================== DATA FETCHING ==================
 
-def fetch_crypto_prices() -> Dict:
+def cached_get(url: str, params: Optional[Dict] = None, ttl: int = CACHE_TTL):
+    """GET a JSON endpoint, reusing a cached response younger than ttl seconds"""
+    key = json.dumps([url, sorted((params or {}).items())])
+    cache_path = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.json')
+    
+    cached = os.path.exists(cache_path)
+    if cached and os.path.getmtime(cache_path) > time.time() - ttl:
+        with open(cache_path, 'rb') as f:
+            return json_loads(f.read())
+    
+    try:
+        response = SESSION.get(url, params=params, timeout=TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        # Timeouts, exhausted 429/5xx retries and error statuses all land here
+        if not cached:
+            raise
+        # Better a stale answer than no newsletter
+        print(f"⚠️  {url} failed ({e}), using cached response")
+        with open(cache_path, 'rb') as f:
+            return json_loads(f.read())
+    data = json_loads(response.content)
+    
+    # Write atomically so a crash never leaves a truncated cache entry
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    atomic_write(cache_path, json_dumps(data))
+    
+    return data
+
+
+def fetch_crypto_prices() -> Prices:
     """Fetch real-time crypto prices from CoinGecko"""
     print("📊 Fetching crypto prices...")
     
-    token_ids = ','.join([v for v in TOKEN_MAP.values() if v])
-    
-    url = f"{COINGECKO_API}/simple/price"
+    # /coins/markets returns price, 24h stats and ATH/ATL in one batched call
+    url = f"{COINGECKO_API}/coins/markets"
     params = {
-        'ids': token_ids,
-        'vs_currencies': 'usd',
-        'include_24hr_change': 'true',
-        'include_market_cap': 'true',
-        'include_24hr_vol': 'true'
+        'vs_currency': 'usd',
+        'ids': _TOKEN_IDS,
+        'price_change_percentage': '24h'
     }
     
-    response = requests.get(url, params=params)
-    data = response.json()
+    data = cached_get(url, params=params)
+    by_id = {coin['id']: coin for coin in data}
     
     # Format the data
     prices = {
-        'btc': {
-            'price': data['bitcoin']['usd'],
-            'change_24h': data['bitcoin']['usd_24h_change'],
-            'volume_24h': data['bitcoin']['usd_24h_vol'],
-            'market_cap': data['bitcoin']['usd_market_cap'],
-            'ath': 73750,  # Historical data
-            'atl': 67.81
-        },
-        'eth': {
-            'price': data['ethereum']['usd'],
-            'change_24h': data['ethereum']['usd_24h_change'],
-            'volume_24h': data['ethereum']['usd_24h_vol'],
-            'market_cap': data['ethereum']['usd_market_cap'],
-            'ath': 4878,
-            'atl': 0.43
-        },
-        'usdt': {
-            'price': data['tether']['usd'],
-            'change_24h': data['tether'].get('usd_24h_change', 0),
-            'volume_24h': data['tether']['usd_24h_vol'],
-            'market_cap': data['tether']['usd_market_cap'],
-            'ath': 1.32,
-            'atl': 0.57
-        },
-        'dai': {
-            'price': data['dai']['usd'],
-            'change_24h': data['dai'].get('usd_24h_change', 0),
-            'volume_24h': data['dai']['usd_24h_vol'],
-            'market_cap': data['dai']['usd_market_cap'],
-            'ath': 1.22,
-            'atl': 0.89
-        },
-        # Placeholder for PLS and HEX (not on CoinGecko)
-        'pls': {
-            'price': 0.000089,
-            'change_24h': 12.4,
-            'ath': 0.000456,
-            'atl': 0.000021
-        },
-        'hex': {
-            'price': 0.0041,
-            'change_24h': 8.7,
-            'ath': 0.5701,
-            'atl': 0.00019
+        symbol: {
+            'price': by_id[coin_id]['current_price'],
+            'change_24h': by_id[coin_id].get('price_change_percentage_24h') or 0,
+            'volume_24h': by_id[coin_id].get('total_volume') or 0,
+            'market_cap': by_id[coin_id].get('market_cap') or 0,
+            'ath': by_id[coin_id]['ath'],
+            'atl': by_id[coin_id]['atl']
         }
+        for symbol, coin_id in TOKEN_MAP.items() if coin_id
     }
     
+    # Copy the inner dicts so callers can't mutate the module constant
+    prices.update({symbol: dict(p) for symbol, p in PLACEHOLDER_PRICES.items()})
+    
     print("✅ Prices fetched successfully!")
     return prices
 
@@ -133,8 +222,7 @@ def fetch_fear_greed_index() -> Dict:
     print("😱 Fetching Fear & Greed Index...")
     
     url = "https://api.alternative.me/fng/"
-    response = requests.get(url)
-    data = response.json()
+    data = cached_get(url)
     
     value = int(data['data'][0]['value'])
     classification = data['data'][0]['value_classification']
@@ -146,9 +234,9 @@ def fetch_fear_greed_index() -> Dict:
     }
 
 
-def get_week_range() -> tuple:
+def get_week_range() -> WeekRange:
     """Get the date range for the current week (Friday to Friday)"""
-    today = datetime.now()
+    today = date.today()
     
     # Find last Friday
     days_since_friday = (today.weekday() - 4) % 7
@@ -168,8 +256,7 @@ def fetch_trending_coins() -> List[Dict]:
     print("🔥 Fetching trending coins...")
     
     url = f"{COINGECKO_API}/search/trending"
-    response = requests.get(url)
-    data = response.json()
+    data = cached_get(url)
     
     trending = []
     for coin in data['coins'][:5]:
@@ -185,39 +272,67 @@ def fetch_trending_coins() -> List[Dict]:
 
 # ================== HTML GENERATION ==================
 
-def generate_html(prices: Dict, fear_greed: Dict, week_range: tuple) -> str:
-    """Generate the complete HTML with updated data"""
-    
-    # Read the base template
-    with open('newsletter_template.html', 'r') as f:
-        html = f.read()
-    
-    # Update date range
-    html = html.replace('{{DATE_RANGE}}', f"{week_range[0]} – {week_range[1]}")
-    
-    # Update prices (JavaScript data)
-    price_js = f"""
-        const realTimePrices = {{
-            btc: {{ price: {prices['btc']['price']}, change: {prices['btc']['change_24h']}, ath: {prices['btc']['ath']}, atl: {prices['btc']['atl']} }},
-            eth: {{ price: {prices['eth']['price']}, change: {prices['eth']['change_24h']}, ath: {prices['eth']['ath']}, atl: {prices['eth']['atl']} }},
-            pls: {{ price: {prices['pls']['price']}, change: {prices['pls']['change_24h']}, ath: {prices['pls']['ath']}, atl: {prices['pls']['atl']} }},
-            hex: {{ price: {prices['hex']['price']}, change: {prices['hex']['change_24h']}, ath: {prices['hex']['ath']}, atl: {prices['hex']['atl']} }},
-            usdt: {{ price: {prices['usdt']['price']}, change: {prices['usdt']['change_24h']}, ath: {prices['usdt']['ath']}, atl: {prices['usdt']['atl']} }},
-            dai: {{ price: {prices['dai']['price']}, change: {prices['dai']['change_24h']}, ath: {prices['dai']['ath']}, atl: {prices['dai']['atl']} }}
-        }};
-    """
+def load_template(path: str = 'newsletter_template.html') -> Template:
+    """Load the newsletter template, re-reading it only when the file changes"""
+    mtime = os.path.getmtime(path)
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     
-    html = html.replace('// {{PRICE_DATA}}', price_js)
+    with open(path, 'r', encoding='utf-8') as f:
+        template = Template(f.read())
+    _TEMPLATE_CACHE[path] = (mtime, template)
+    return template
+
+
+def generate_html(prices: Prices, fear_greed: Dict[str, Any], week_range: WeekRange) -> str:
+    """Generate the complete HTML with updated data"""
     
-    # Update Fear & Greed Index
-    html = html.replace('{{FEAR_GREED_VALUE}}', str(fear_greed['value']))
-    html = html.replace('{{FEAR_GREED_CLASS}}', fear_greed['classification'].upper())
+    template = load_template()
     
-    return html
+    # Update prices (JavaScript data; JSON is a valid JS object literal)
+    real_time_prices = {
+        symbol: {
+            'price': p['price'],
+            'change': p['change_24h'],
+            'ath': p['ath'],
+            'atl': p['atl']
+        }
+        for symbol, p in prices.items()
+    }
+    price_js = f"const realTimePrices = {json_dumps(real_time_prices)};"
+    
+    # Fill date range, price data and Fear & Greed Index in a single pass
+    return template.safe_substitute(
+        DATE_RANGE=f"{week_range[0]} – {week_range[1]}",
+        PRICE_DATA=price_js,
+        FEAR_GREED_VALUE=fear_greed['value'],
+        FEAR_GREED_CLASS=fear_greed['classification'].upper()
+    )
 
 
 # ================== DEPLOYMENT ==================
 
+def load_deployed_sha() -> Optional[str]:
+    """Return the file SHA recorded by the last successful deploy, if any"""
+    try:
+        with open(DEPLOY_STATE_FILE, 'rb') as f:
+            return json_loads(f.read())['sha']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_deployed_sha(sha: str):
+    """Record the file SHA GitHub returned for our latest deploy"""
+    atomic_write(DEPLOY_STATE_FILE, json_dumps({'sha': sha}))
+
+
+def fetch_remote_sha(url: str, headers: Dict) -> str:
+    """Get the current SHA of the deployed file from GitHub"""
+    response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+    return json_loads(response.content).get('sha', '')
+
+
 def deploy_to_github(html: str, github_token: str, github_username: str):
     """Deploy updated HTML to GitHub Pages"""
     print("🚀 Deploying to GitHub Pages...")
@@ -228,18 +343,27 @@ def deploy_to_github(html: str, github_token: str, github_username: str):
     # GitHub API endpoint
     url = f"{GITHUB_API}/repos/{github_username}/{repo_name}/contents/{file_path}"
     
-    # Get current file SHA (needed for update)
     headers = {
         'Authorization': f'token {github_token}',
         'Accept': 'application/vnd.github.v3+json'
     }
     
-    response = requests.get(url, headers=headers)
-    sha = response.json().get('sha', '')
+    # GitHub's file SHA is the git blob hash, so identical content can skip the upload
+    html_bytes = html.encode()
+    blob_sha = hashlib.sha1(f"blob {len(html_bytes)}\0".encode() + html_bytes).hexdigest()
+    
+    # Current file SHA (needed for update): our last deploy's SHA is good enough
+    # as the PUT precondition, but only skip the upload on GitHub's own word
+    sha = load_deployed_sha()
+    if sha is None or sha == blob_sha:
+        sha = fetch_remote_sha(url, headers)
+    if sha == blob_sha:
+        save_deployed_sha(sha)
+        print("✅ No changes to deploy, index.html is already up to date")
+        return
     
     # Update file
-    import base64
-    content_encoded = base64.b64encode(html.encode()).decode()
+    content_encoded = base64.b64encode(html_bytes).decode()
     
     data = {
         'message': f'Auto-update newsletter - {datetime.now().strftime("%Y-%m-%d")}',
@@ -247,21 +371,56 @@ def deploy_to_github(html: str, github_token: str, github_username: str):
         'sha': sha
     }
     
-    response = requests.put(url, headers=headers, json=data)
+    response = SESSION.put(url, headers=headers, json=data, timeout=TIMEOUT)
+    
+    # 409 means the file changed since our last deploy; refresh the SHA once
+    if response.status_code == 409:
+        sha = fetch_remote_sha(url, headers)
+        if sha == blob_sha:
+            save_deployed_sha(sha)
+            print("✅ No changes to deploy, index.html is already up to date")
+            return
+        data['sha'] = sha
+        response = SESSION.put(url, headers=headers, json=data, timeout=TIMEOUT)
     
     if response.status_code in [200, 201]:
+        save_deployed_sha(json_loads(response.content)['content']['sha'])
         print(f"✅ Deployed successfully!")
         print(f"🌐 Live at: https://{github_username}.github.io/{repo_name}")
     else:
-        print(f"❌ Deployment failed: {response.json()}")
+        print(f"❌ Deployment failed: {json_loads(response.content)}")
 
 
 # ================== SOCIAL MEDIA ==================
 
-def generate_twitter_thread(prices: Dict, week_range: tuple) -> List[str]:
+# Indexed by (change > 0): bool is an int, so False -> 0, True -> 1
+_EMOJI = ("🔴", "🟢")
+_DIRECTION = ('down', 'up')
+
+
+def summarize_moves(prices: Prices) -> Dict[str, Dict[str, Any]]:
+    """Look up each featured coin's price and 24h move once for the social posts"""
+    moves: Dict[str, Dict[str, Any]] = {}
+    for symbol in ('btc', 'eth', 'pls', 'hex'):
+        change = prices[symbol]['change_24h']
+        rising = change > 0
+        moves[symbol] = {
+            'price': prices[symbol]['price'],
+            'change': change,
+            'abs_change': abs(change),
+            'emoji': _EMOJI[rising],
+            'direction': _DIRECTION[rising]
+        }
+    return moves
+
+
+def generate_twitter_thread(prices: Prices, week_range: WeekRange) -> List[str]:
     """Generate Twitter thread content"""
     
-    tweets = []
+    moves = summarize_moves(prices)
+    btc, eth, pls, hex_ = moves['btc'], moves['eth'], moves['pls'], moves['hex']
+    
+    tweets: List[str] = []
     
     # Tweet 1: Header
     tweets.append(f"""🧠 CRYPTO INTEL WEEKLY
@@ -277,17 +436,12 @@ Your weekly dose of crypto market insights 🔥
 Thread below 👇""")
     
     # Tweet 2: Price Summary
-    btc_emoji = "🟢" if prices['btc']['change_24h'] > 0 else "🔴"
-    eth_emoji = "🟢" if prices['eth']['change_24h'] > 0 else "🔴"
-    pls_emoji = "🟢" if prices['pls']['change_24h'] > 0 else "🔴"
-    hex_emoji = "🟢" if prices['hex']['change_24h'] > 0 else "🔴"
-    
     tweets.append(f"""📈 PRICE MOVERS
 
-BTC: ${prices['btc']['price']:,.0f} ({prices['btc']['change_24h']:+.1f}%) {btc_emoji}
-ETH: ${prices['eth']['price']:,.2f} ({prices['eth']['change_24h']:+.1f}%) {eth_emoji}
-PLS: ${prices['pls']['price']:.6f} ({prices['pls']['change_24h']:+.1f}%) {pls_emoji}
-HEX: ${prices['hex']['price']:.4f} ({prices['hex']['change_24h']:+.1f}%) {hex_emoji}
+BTC: ${btc['price']:,.0f} ({btc['change']:+.1f}%) {btc['emoji']}
+ETH: ${eth['price']:,.2f} ({eth['change']:+.1f}%) {eth['emoji']}
+PLS: ${pls['price']:.6f} ({pls['change']:+.1f}%) {pls['emoji']}
+HEX: ${hex_['price']:.4f} ({hex_['change']:+.1f}%) {hex_['emoji']}
 
 #Bitcoin #Ethereum #Crypto""")
     
@@ -303,27 +457,28 @@ https://{os.getenv('GITHUB_USERNAME', 'your-username')}.github.io/crypto-intel-w
     return tweets
 
 
-def save_twitter_content(tweets: List[str]):
-    """Save Twitter thread to file"""
-    with open('twitter_thread.txt', 'w', encoding='utf-8') as f:
-        for i, tweet in enumerate(tweets, 1):
-            f.write(f"TWEET {i}:\n")
-            f.write(tweet)
-            f.write("\n\n" + "="*50 + "\n\n")
-    
-    print("✅ Twitter thread saved to twitter_thread.txt")
+def format_twitter_content(tweets: List[str]) -> str:
+    """Render the Twitter thread as the text saved to twitter_thread.txt"""
+    separator = "="*50
+    return "".join(
+        f"TWEET {i}:\n{tweet}\n\n{separator}\n\n"
+        for i, tweet in enumerate(tweets, 1)
+    )
 
 
-def generate_instagram_caption(prices: Dict, week_range: tuple) -> str:
+def generate_instagram_caption(prices: Prices, week_range: WeekRange) -> str:
     """Generate Instagram caption"""
     
+    moves = summarize_moves(prices)
+    btc, eth, pls, hex_ = moves['btc'], moves['eth'], moves['pls'], moves['hex']
+    
     caption = f"""🧠 CRYPTO INTEL WEEKLY | {week_range[0]} – {week_range[1]}
 
 This week in crypto:
-📈 BTC {'up' if prices['btc']['change_24h'] > 0 else 'down'} {abs(prices['btc']['change_24h']):.1f}% to ${prices['btc']['price']:,.0f}
-📈 ETH {'up' if prices['eth']['change_24h'] > 0 else 'down'} {abs(prices['eth']['change_24h']):.1f}% to ${prices['eth']['price']:,.2f}
-🚀 PLS {'up' if prices['pls']['change_24h'] > 0 else 'down'} {abs(prices['pls']['change_24h']):.1f}%
-💎 HEX {'up' if prices['hex']['change_24h'] > 0 else 'down'} {abs(prices['hex']['change_24h']):.1f}%
+📈 BTC {btc['direction']} {btc['abs_change']:.1f}% to ${btc['price']:,.0f}
+📈 ETH {eth['direction']} {eth['abs_change']:.1f}% to ${eth['price']:,.2f}
+🚀 PLS {pls['direction']} {pls['abs_change']:.1f}%
+💎 HEX {hex_['direction']} {hex_['abs_change']:.1f}%
 
 Swipe 👉 for detailed charts, data & analysis
 
@@ -347,44 +502,57 @@ def main():
     print("="*60)
     
     try:
-        # 1. Fetch all data
-        prices = fetch_crypto_prices()
-        fear_greed = fetch_fear_greed_index()
+        # 1. Fetch all data (network-bound, so run the requests concurrently)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            prices_future = executor.submit(fetch_crypto_prices)
+            fear_greed_future = executor.submit(fetch_fear_greed_index)
+            prices = prices_future.result()
+            fear_greed = fear_greed_future.result()
         week_range = get_week_range()
         
         print(f"\n📅 Newsletter week: {week_range[0]} – {week_range[1]}")
         
         # 2. Generate HTML (if template exists)
+        html = None
+        outputs = {}
         if os.path.exists('newsletter_template.html'):
             html = generate_html(prices, fear_greed, week_range)
-            
-            # Save locally
-            with open('index.html', 'w') as f:
-                f.write(html)
-            print("✅ HTML generated successfully!")
-            
-            # 3. Deploy to GitHub (if credentials provided)
-            github_token = os.getenv('GITHUB_TOKEN')
-            github_username = os.getenv('GITHUB_USERNAME')
-            
-            if github_token and github_username:
-                deploy_to_github(html, github_token, github_username)
-            else:
-                print("⚠️  GitHub credentials not found. Skipping deployment.")
-                print("   Set GITHUB_TOKEN and GITHUB_USERNAME environment variables.")
+            outputs['index.html'] = html
         else:
             print("⚠️  newsletter_template.html not found. Skipping HTML generation.")
         
-        # 4. Generate social media content
-        twitter_thread = generate_twitter_thread(prices, week_range)
-        save_twitter_content(twitter_thread)
-        
-        instagram_caption = generate_instagram_caption(prices, week_range)
-        with open('instagram_caption.txt', 'w',encoding='utf-8') as f:
-            f.write(instagram_caption)
-        print("✅ Instagram caption saved to instagram_caption.txt")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # 3. Deploy to GitHub (if credentials provided) in the background,
+            #    hiding its network latency behind the local work below
+            deploy_future = None
+            if html is not None:
+                github_token = os.getenv('GITHUB_TOKEN')
+                github_username = os.getenv('GITHUB_USERNAME')
+                
+                if github_token and github_username:
+                    deploy_future = executor.submit(deploy_to_github, html, github_token, github_username)
+                else:
+                    print("⚠️  GitHub credentials not found. Skipping deployment.")
+                    print("   Set GITHUB_TOKEN and GITHUB_USERNAME environment variables.")
+            
+            # 4. Generate social media content
+            twitter_thread = generate_twitter_thread(prices, week_range)
+            outputs['twitter_thread.txt'] = format_twitter_content(twitter_thread)
+            
+            instagram_caption = generate_instagram_caption(prices, week_range)
+            outputs['instagram_caption.txt'] = instagram_caption
+            
+            # 5. Save locally (independent files, so overlap the writes)
+            list(executor.map(atomic_write, outputs.keys(), outputs.values()))
+            if html is not None:
+                print("✅ HTML generated successfully!")
+            print("✅ Twitter thread saved to twitter_thread.txt")
+            print("✅ Instagram caption saved to instagram_caption.txt")
+            
+            if deploy_future is not None:
+                deploy_future.result()
         
-        # 5. Summary
+        # 6. Summary
         print("\n" + "="*60)
         print("✅ AUTOMATION COMPLETE!")
         print("="*60)
@@ -401,6 +569,10 @@ def main():
         print("   3. Create Instagram carousel and use caption from instagram_caption.txt")
         print("="*60)
         
+    except requests.RequestException as e:
+        # Exit nonzero so cron reports the failed run
+        print(f"\n❌ Network error: {str(e)}")
+        sys.exit(1)
     except Exception as e:
         print(f"\n❌ Error occurred: {str(e)}")
         import traceback